@@ -11,7 +11,6 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import copy
 import inspect
 import types
 from argparse import Namespace
@@ -19,7 +18,7 @@ from typing import MutableMapping, Optional, Sequence, Union
 
 from pytorch_lightning.core.saving import ALLOWED_CONFIG_TYPES, PRIMITIVE_TYPES
 from pytorch_lightning.utilities import AttributeDict
-from pytorch_lightning.utilities.parsing import save_hyperparameters
+from pytorch_lightning.utilities.parsing import _deepcopy_hparams, save_hyperparameters
 
 
 class HyperparametersMixin:
@@ -147,4 +146,4 @@ class HyperparametersMixin:
         if not hasattr(self, "_hparams_initial"):
             return AttributeDict()
         # prevent any change
-        return copy.deepcopy(self._hparams_initial)
+        return _deepcopy_hparams(self._hparams_initial)
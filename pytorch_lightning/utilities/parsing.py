@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import copy
+import functools
 import inspect
+import io
 import pickle
 import types
 from argparse import Namespace
 from dataclasses import fields, is_dataclass
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Type, Union
+from weakref import WeakKeyDictionary
 
 from typing_extensions import Literal
 
@@ -25,8 +28,19 @@ import pytorch_lightning as pl
 from pytorch_lightning.utilities import _OMEGACONF_AVAILABLE
 from pytorch_lightning.utilities.warnings import rank_zero_warn
 
-if _OMEGACONF_AVAILABLE:
-    from omegaconf.dictconfig import DictConfig
+_TRUE_VALUES = frozenset(("y", "yes", "t", "true", "on", "1"))
+_FALSE_VALUES = frozenset(("n", "no", "f", "false", "off", "0"))
+# builtin scalar types, which can always be pickled and cannot be mutated, so are safe to share between copies
+_BUILTIN_SCALAR_TYPES = frozenset((int, float, bool, str, bytes, type(None)))
+_IMMUTABLE_CONTAINER_TYPES = frozenset((tuple, frozenset))
+# the parsed `__init__` signatures and the init argument names to collect per class, `__init__` is fixed by the class.
+# weakly keyed so classes created on the fly can still be garbage collected
+_INIT_KEYS_CACHE: "WeakKeyDictionary[type, Tuple[str, Optional[str], Optional[str], Tuple[str, ...]]]" = (
+    WeakKeyDictionary()
+)
+_INIT_ARG_NAMES_CACHE: "WeakKeyDictionary[type, Tuple[Tuple[str, ...], Optional[str], FrozenSet[str]]]" = (
+    WeakKeyDictionary()
+)
 
 
 def str_to_bool_or_str(val: str) -> Union[str, bool]:
@@ -35,10 +49,17 @@ def str_to_bool_or_str(val: str) -> Union[str, bool]:
 
     True values are 'y', 'yes', 't', 'true', 'on', and '1'; false values are 'n', 'no', 'f', 'false', 'off', and '0'.
     """
+    # single characters are the most common case, e.g. "1" or "0", dispatch them without lowering the string
+    if len(val) == 1:
+        if val in "yYtT1":
+            return True
+        if val in "nNfF0":
+            return False
+        return val
     lower = val.lower()
-    if lower in ("y", "yes", "t", "true", "on", "1"):
+    if lower in _TRUE_VALUES:
         return True
-    if lower in ("n", "no", "f", "false", "off", "0"):
+    if lower in _FALSE_VALUES:
         return False
     return val
 
@@ -85,11 +106,24 @@ def str_to_bool_or_int(val: str) -> Union[bool, int, str]:
         return val_converted
 
 
+class _NullSink(io.RawIOBase):
+    """Writable stream which discards everything written to it."""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        return len(b)
+
+
 def is_picklable(obj: object) -> bool:
     """Tests if an object can be pickled."""
+    if type(obj) in _BUILTIN_SCALAR_TYPES:
+        return True
 
     try:
-        pickle.dumps(obj)
+        # stream into a sink instead of `pickle.dumps` to avoid materializing the serialized bytes
+        pickle.Pickler(_NullSink()).dump(obj)
         return True
     except (pickle.PickleError, AttributeError):
         return False
@@ -118,6 +152,21 @@ def parse_class_init_keys(cls: Type["pl.LightningModule"]) -> Tuple[str, Optiona
     >>> parse_class_init_keys(Model)
     ('self', 'my_args', 'my_kwargs')
     """
+    n_self, n_args, n_kwargs, _ = _parse_class_init_keys_cached(cls)
+    return n_self, n_args, n_kwargs
+
+
+def _parse_class_init_keys_cached(
+    cls: Type["pl.LightningModule"],
+) -> Tuple[str, Optional[str], Optional[str], Tuple[str, ...]]:
+    """Inspect the signature of ``cls.__init__`` once per class.
+
+    Returns the names for self, *args and **kwargs along with the names of all the ``__init__`` parameters.
+    """
+    cached = _INIT_KEYS_CACHE.get(cls)
+    if cached is not None:
+        return cached
+
     init_parameters = inspect.signature(cls.__init__).parameters
     # docs claims the params are always ordered
     # https://docs.python.org/3/library/inspect.html#inspect.Signature.parameters
@@ -137,31 +186,43 @@ def parse_class_init_keys(cls: Type["pl.LightningModule"]) -> Tuple[str, Optiona
     n_args = _get_first_if_any(init_params, inspect.Parameter.VAR_POSITIONAL)
     n_kwargs = _get_first_if_any(init_params, inspect.Parameter.VAR_KEYWORD)
 
-    return n_self, n_args, n_kwargs
+    cached = _INIT_KEYS_CACHE[cls] = (n_self, n_args, n_kwargs, tuple(init_parameters))
+    return cached
+
+
+def _get_init_arg_names(cls: Type["pl.LightningModule"]) -> Tuple[Tuple[str, ...], Optional[str], FrozenSet[str]]:
+    """Returns the ``__init__`` parameter names to collect, the name of the ``**kwargs`` parameter and the names to
+    exclude from it."""
+    cached = _INIT_ARG_NAMES_CACHE.get(cls)
+    if cached is not None:
+        return cached
+
+    self_var, args_var, kwargs_var, init_parameters = _parse_class_init_keys_cached(cls)
+    filtered_vars = [n for n in (self_var, args_var, kwargs_var) if n]
+    exclude_argnames = frozenset((*filtered_vars, "__class__", "frame", "frame_args"))
+    include_argnames = tuple(n for n in init_parameters if n not in exclude_argnames)
+    cached = _INIT_ARG_NAMES_CACHE[cls] = (include_argnames, kwargs_var, exclude_argnames)
+    return cached
 
 
 def get_init_args(frame: types.FrameType) -> Dict[str, Any]:
-    _, _, _, local_vars = inspect.getargvalues(frame)
+    local_vars = frame.f_locals
     if "__class__" not in local_vars:
         return {}
     cls = local_vars["__class__"]
-    init_parameters = inspect.signature(cls.__init__).parameters
-    self_var, args_var, kwargs_var = parse_class_init_keys(cls)
-    filtered_vars = [n for n in (self_var, args_var, kwargs_var) if n]
-    exclude_argnames = (*filtered_vars, "__class__", "frame", "frame_args")
+    include_argnames, kwargs_var, exclude_argnames = _get_init_arg_names(cls)
     # only collect variables that appear in the signature
-    local_args = {k: local_vars[k] for k in init_parameters.keys()}
+    local_args = {k: local_vars[k] for k in include_argnames if k in local_vars}
     # kwargs_var might be None => raised an error by mypy
     if kwargs_var:
-        local_args.update(local_args.get(kwargs_var, {}))
-    local_args = {k: v for k, v in local_args.items() if k not in exclude_argnames}
+        local_args.update((k, v) for k, v in local_vars.get(kwargs_var, {}).items() if k not in exclude_argnames)
     return local_args
 
 
 def collect_init_args(
     frame: types.FrameType, path_args: List[Dict[str, Any]], inside: bool = False
 ) -> List[Dict[str, Any]]:
-    """Recursively collects the arguments passed to the child constructors in the inheritance tree.
+    """Collects the arguments passed to the child constructors in the inheritance tree.
 
     Args:
         frame: the current stack frame
@@ -173,18 +234,14 @@ def collect_init_args(
           constructor at that level. The last entry corresponds to the constructor call of the
           most specific class in the hierarchy.
     """
-    _, _, _, local_vars = inspect.getargvalues(frame)
     # frame.f_back must be of a type types.FrameType for get_init_args/collect_init_args due to mypy
-    if not isinstance(frame.f_back, types.FrameType):
-        return path_args
-
-    if "__class__" in local_vars:
-        local_args = get_init_args(frame)
-        # recursive update
-        path_args.append(local_args)
-        return collect_init_args(frame.f_back, path_args, inside=True)
-    if not inside:
-        return collect_init_args(frame.f_back, path_args, inside)
+    while isinstance(frame.f_back, types.FrameType):
+        if "__class__" in frame.f_locals:
+            path_args.append(get_init_args(frame))
+            inside = True
+        elif inside:
+            break
+        frame = frame.f_back
     return path_args
 
 
@@ -192,31 +249,72 @@ def flatten_dict(source: Dict[str, Any], result: Optional[Dict[str, Any]] = None
     if result is None:
         result = {}
 
-    for k, v in source.items():
-        if isinstance(v, dict):
-            _ = flatten_dict(v, result)
-        else:
+    # depth-first walk with an explicit stack of iterators to keep the insertion order of a recursive traversal
+    stack = [iter(source.items())]
+    while stack:
+        for k, v in stack[-1]:
+            # the exact type check is cheaper and covers most values, `isinstance` catches the subclasses
+            if type(v) is dict or isinstance(v, dict):
+                stack.append(iter(v.items()))
+                break
             result[k] = v
+        else:
+            stack.pop()
 
     return result
 
 
+def _is_immutable(value: Any) -> bool:
+    value_type = type(value)
+    if value_type in _BUILTIN_SCALAR_TYPES:
+        return True
+    if value_type in _IMMUTABLE_CONTAINER_TYPES:
+        return all(_is_immutable(v) for v in value)
+    return False
+
+
+def _deepcopy_hparams(hparams: Any) -> Any:
+    """Deep copies the hyperparameters, falling back to a shallow copy if all the values are immutable."""
+    if isinstance(hparams, dict) and all(_is_immutable(v) for v in hparams.values()):
+        return copy.copy(hparams)
+    return copy.deepcopy(hparams)
+
+
+def _safe_eq(a: Any, b: Any) -> bool:
+    """Compares two objects, treating comparisons which fail or do not reduce to a single bool as not equal."""
+    try:
+        return bool(a == b)
+    except (RuntimeError, TypeError, ValueError):
+        # e.g. the truth value of tensors or arrays with more than one element is ambiguous
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _get_hparams_container_types() -> Tuple[type, ...]:
+    """Returns the types which are saved as a whole by :func:`save_hyperparameters`.
+
+    ``omegaconf`` is only imported on first use.
+    """
+    if _OMEGACONF_AVAILABLE:
+        from omegaconf.dictconfig import DictConfig
+
+        return Namespace, dict, DictConfig
+    return Namespace, dict
+
+
 def save_hyperparameters(
     obj: Any, *args: Any, ignore: Optional[Union[Sequence[str], str]] = None, frame: Optional[types.FrameType] = None
 ) -> None:
     """See :meth:`~pytorch_lightning.LightningModule.save_hyperparameters`"""
-    hparams_container_types = [Namespace, dict]
-    if _OMEGACONF_AVAILABLE:
-        hparams_container_types.append(DictConfig)
     # empty container
     if len(args) == 1 and not isinstance(args, str) and not args[0]:
         return
     # container
-    elif len(args) == 1 and isinstance(args[0], tuple(hparams_container_types)):
+    elif len(args) == 1 and isinstance(args[0], _get_hparams_container_types()):
         hp = args[0]
         obj._hparams_name = "hparams"
         obj._set_hparams(hp)
-        obj._hparams_initial = copy.deepcopy(obj._hparams)
+        obj._hparams_initial = _deepcopy_hparams(obj._hparams)
         return
     # non-container args parsing
     else:
@@ -237,10 +335,9 @@ def save_hyperparameters(
 
         if ignore is not None:
             if isinstance(ignore, str):
-                ignore = [ignore]
-            if isinstance(ignore, (list, tuple, set)):
-                ignore = [arg for arg in ignore if isinstance(arg, str)]
-            init_args = {k: v for k, v in init_args.items() if k not in ignore}
+                ignore = (ignore,)
+            ignore_names = frozenset(arg for arg in ignore if isinstance(arg, str))
+            init_args = {k: v for k, v in init_args.items() if k not in ignore_names}
 
         if not args:
             # take all arguments
@@ -251,7 +348,10 @@ def save_hyperparameters(
             isx_non_str = [i for i, arg in enumerate(args) if not isinstance(arg, str)]
             if len(isx_non_str) == 1:
                 hp = args[isx_non_str[0]]
-                cand_names = [k for k, v in init_args.items() if v == hp]
+                # the passed object is usually the very same one received by `__init__`
+                cand_names = [k for k, v in init_args.items() if v is hp]
+                if not cand_names:
+                    cand_names = [k for k, v in init_args.items() if _safe_eq(v, hp)]
                 obj._hparams_name = cand_names[0] if cand_names else None
             else:
                 hp = {arg: init_args[arg] for arg in args if isinstance(arg, str)}
@@ -260,8 +360,8 @@ def save_hyperparameters(
     # `hparams` are expected here
     if hp:
         obj._set_hparams(hp)
-    # make deep copy so  there is not other runtime changes reflected
-    obj._hparams_initial = copy.deepcopy(obj._hparams)
+    # make deep copy so there is not other runtime changes reflected
+    obj._hparams_initial = _deepcopy_hparams(obj._hparams)
 
 
 class AttributeDict(Dict):
@@ -280,6 +380,9 @@ class AttributeDict(Dict):
     "new_key": 42
     """
 
+    # attributes are stored as keys, no per-instance `__dict__` is needed
+    __slots__ = ()
+
     def __getattr__(self, key: str) -> Optional[Any]:
         try:
             return self[key]
@@ -299,6 +402,10 @@ class AttributeDict(Dict):
         return out
 
 
+# sentinel to probe attributes with a single `getattr` call
+_MISSING = object()
+
+
 def _lightning_get_all_attr_holders(model: "pl.LightningModule", attribute: str) -> List[Any]:
     """Special attribute finding for Lightning.
 
@@ -310,17 +417,18 @@ def _lightning_get_all_attr_holders(model: "pl.LightningModule", attribute: str)
     holders: List[Any] = []
 
     # Check if attribute in model
-    if hasattr(model, attribute):
+    if getattr(model, attribute, _MISSING) is not _MISSING:
         holders.append(model)
 
     # Check if attribute in model.hparams, either namespace or dict
-    if hasattr(model, "hparams"):
-        if attribute in model.hparams:
-            holders.append(model.hparams)
+    hparams: Any = getattr(model, "hparams", _MISSING)
+    if hparams is not _MISSING and attribute in hparams:
+        holders.append(hparams)
 
     # Check if the attribute in datamodule (datamodule gets registered in Trainer)
-    if trainer is not None and trainer.datamodule is not None and hasattr(trainer.datamodule, attribute):
-        holders.append(trainer.datamodule)
+    datamodule = trainer.datamodule if trainer is not None else None
+    if datamodule is not None and getattr(datamodule, attribute, _MISSING) is not _MISSING:
+        holders.append(datamodule)
 
     return holders
 
@@ -331,11 +439,19 @@ def _lightning_get_first_attr_holder(model: "pl.LightningModule", attribute: str
     Gets the object or dict that holds attribute, or None. Checks for attribute in model namespace, the old hparams
     namespace/dict, and the datamodule, returns the last one that has it.
     """
-    holders = _lightning_get_all_attr_holders(model, attribute)
-    if len(holders) == 0:
-        return None
-    # using the last holder to preserve backwards compatibility
-    return holders[-1]
+    # probe in reverse order and return on the first hit, as the last holder is used to preserve backwards compatibility
+    trainer = getattr(model, "trainer", None)
+    datamodule = trainer.datamodule if trainer is not None else None
+    if datamodule is not None and getattr(datamodule, attribute, _MISSING) is not _MISSING:
+        return datamodule
+
+    hparams: Any = getattr(model, "hparams", _MISSING)
+    if hparams is not _MISSING and attribute in hparams:
+        return hparams
+
+    if getattr(model, attribute, _MISSING) is not _MISSING:
+        return model
+    return None
 
 
 def lightning_hasattr(model: "pl.LightningModule", attribute: str) -> bool:
@@ -17,7 +17,7 @@ import torch
 from torch.utils.data import DataLoader
 
 from pytorch_lightning.core.datamodule import LightningDataModule
-from pytorch_lightning.utilities import _module_available
+from pytorch_lightning.utilities import _module_available, _TORCH_GREATER_EQUAL_1_7
 from tests.helpers.datasets import MNIST, SklearnDataset, TrialMNIST
 
 _SKLEARN_AVAILABLE = _module_available("sklearn")
@@ -65,9 +65,13 @@ class MNISTDataModule(LightningDataModule):
 
 
 class SklearnDataModule(LightningDataModule):
-    def __init__(self, sklearn_dataset, x_type, y_type, batch_size: int = 10):
+    def __init__(
+        self, sklearn_dataset, x_type, y_type, batch_size: int = 10, num_workers: int = 0, pin_memory: bool = False
+    ):
         super().__init__()
         self.batch_size = batch_size
+        self.num_workers = num_workers
+        self.pin_memory = pin_memory
         self._x, self._y = sklearn_dataset
         self._split_data()
         self._x_type = x_type
@@ -81,20 +85,27 @@ class SklearnDataModule(LightningDataModule):
             self.x_train, self.y_train, test_size=0.40, random_state=42
         )
 
-    def train_dataloader(self):
+    def _dataloader(self, x, y):
+        kwargs = {}
+        if self.num_workers > 0 and _TORCH_GREATER_EQUAL_1_7:
+            # keep the workers alive between epochs instead of forking them again
+            kwargs["persistent_workers"] = True
         return DataLoader(
-            SklearnDataset(self.x_train, self.y_train, self._x_type, self._y_type), batch_size=self.batch_size
+            SklearnDataset(x, y, self._x_type, self._y_type),
+            batch_size=self.batch_size,
+            num_workers=self.num_workers,
+            pin_memory=self.pin_memory,
+            **kwargs,
         )
 
+    def train_dataloader(self):
+        return self._dataloader(self.x_train, self.y_train)
+
     def val_dataloader(self):
-        return DataLoader(
-            SklearnDataset(self.x_valid, self.y_valid, self._x_type, self._y_type), batch_size=self.batch_size
-        )
+        return self._dataloader(self.x_valid, self.y_valid)
 
     def test_dataloader(self):
-        return DataLoader(
-            SklearnDataset(self.x_test, self.y_test, self._x_type, self._y_type), batch_size=self.batch_size
-        )
+        return self._dataloader(self.x_test, self.y_test)
 
     @property
     def sample(self):
@@ -102,11 +113,18 @@ class SklearnDataModule(LightningDataModule):
 
 
 class ClassifDataModule(SklearnDataModule):
-    def __init__(self, num_features=32, length=800, num_classes=3, batch_size=10):
+    def __init__(self, num_features=32, length=800, num_classes=3, batch_size=10, num_workers=0, pin_memory=False):
         data = make_classification(
             n_samples=length, n_features=num_features, n_classes=num_classes, n_clusters_per_class=1, random_state=42
         )
-        super().__init__(data, x_type=torch.float32, y_type=torch.long, batch_size=batch_size)
+        super().__init__(
+            data,
+            x_type=torch.float32,
+            y_type=torch.long,
+            batch_size=batch_size,
+            num_workers=num_workers,
+            pin_memory=pin_memory,
+        )
 
 
 class RegressDataModule(SklearnDataModule):
@@ -8,12 +8,14 @@ import pytest
 import torch
 import torch.nn.functional as F
 from torch import nn, Tensor
+from torch.nn.utils import parameters_to_vector
 from torch.optim import Optimizer
 from torch.utils.data import DataLoader
 from torchmetrics import Accuracy
 
-from pytorch_lightning import LightningDataModule, LightningModule, seed_everything, Trainer
+from pytorch_lightning import __version__, LightningDataModule, LightningModule, Trainer
 from pytorch_lightning.callbacks import Callback, LearningRateMonitor, ModelCheckpoint
+from pytorch_lightning.loops.optimization.optimizer_loop import Closure, ClosureResult
 from pytorch_lightning.plugins import DeepSpeedPlugin, DeepSpeedPrecisionPlugin
 from pytorch_lightning.plugins.training_type.deepspeed import LightningDeepSpeedModule
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
@@ -24,7 +26,9 @@ from tests.helpers.runif import RunIf
 
 if _DEEPSPEED_AVAILABLE:
     import deepspeed
-    from deepspeed.utils.zero_to_fp32 import convert_zero_checkpoint_to_fp32_state_dict
+    from deepspeed.runtime.lr_schedules import WarmupLR
+    from deepspeed.runtime.zero.stage2 import FP16_DeepSpeedZeroOptimizer
+    from deepspeed.utils.zero_to_fp32 import get_fp32_state_dict_from_zero_checkpoint
 
 
 class ModelParallelBoringModel(BoringModel):
@@ -91,11 +95,12 @@ def test_deepspeed_lightning_module_precision(tmpdir):
     model = BoringModel()
     module = LightningDeepSpeedModule(model, precision=16)
 
-    module.cuda().half()
+    # cast before moving so only half precision weights are copied to the device
+    module.half().cuda()
     assert module.dtype == torch.half
     assert model.dtype == torch.half
 
-    x = torch.randn((1, 32), dtype=torch.float).cuda()
+    x = torch.randn((1, 32), dtype=torch.float, device="cuda")
     out = module(x)
 
     assert out.dtype == torch.half
@@ -105,7 +110,7 @@ def test_deepspeed_lightning_module_precision(tmpdir):
     assert model.dtype == torch.double
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def deepspeed_config():
     return {
         "optimizer": {"type": "SGD", "params": {"lr": 3e-5}},
@@ -121,6 +126,35 @@ def deepspeed_zero_config(deepspeed_config):
     return {**deepspeed_config, "zero_allow_untested_optimizer": True, "zero_optimization": {"stage": 2}}
 
 
+@pytest.fixture(scope="session")
+def deepspeed_config_path(tmp_path_factory, deepspeed_config):
+    path = tmp_path_factory.mktemp("ds") / "temp.json"
+    path.write_text(json.dumps(deepspeed_config))
+    return str(path)
+
+
+@pytest.fixture
+def stage3_trainer_factory(tmpdir):
+    """Returns a callable building the ZeRO Stage 3 ``Trainer`` used by the smoke tests below, writing to the test's
+    ``tmpdir``.
+
+    Keyword arguments override the defaults.
+    """
+
+    def factory(**kwargs) -> Trainer:
+        trainer_kwargs = dict(
+            default_root_dir=tmpdir,
+            plugins=[DeepSpeedPlugin(stage=3)],
+            gpus=2,
+            fast_dev_run=True,
+            precision=16,
+        )
+        trainer_kwargs.update(kwargs)
+        return Trainer(**trainer_kwargs)
+
+    return factory
+
+
 @RunIf(deepspeed=True)
 @pytest.mark.parametrize("input", ("deepspeed", DeepSpeedPlugin))
 def test_deepspeed_plugin_string(tmpdir, input):
@@ -134,12 +168,9 @@ def test_deepspeed_plugin_string(tmpdir, input):
 
 
 @RunIf(deepspeed=True)
-def test_deepspeed_plugin_env(tmpdir, monkeypatch, deepspeed_config):
+def test_deepspeed_plugin_env(tmpdir, monkeypatch, deepspeed_config, deepspeed_config_path):
     """Test to ensure that the plugin can be passed via a string with an environment variable."""
-    config_path = os.path.join(tmpdir, "temp.json")
-    with open(config_path, "w") as f:
-        f.write(json.dumps(deepspeed_config))
-    monkeypatch.setenv("PL_DEEPSPEED_CONFIG_PATH", config_path)
+    monkeypatch.setenv("PL_DEEPSPEED_CONFIG_PATH", deepspeed_config_path)
 
     trainer = Trainer(fast_dev_run=True, default_root_dir=tmpdir, plugins="deepspeed")
 
@@ -181,12 +212,9 @@ def test_deepspeed_with_invalid_config_path(tmpdir):
 
 
 @RunIf(deepspeed=True)
-def test_deepspeed_with_env_path(tmpdir, monkeypatch, deepspeed_config):
+def test_deepspeed_with_env_path(monkeypatch, deepspeed_config, deepspeed_config_path):
     """Test to ensure if we pass an env variable, we load the config from the path."""
-    config_path = os.path.join(tmpdir, "temp.json")
-    with open(config_path, "w") as f:
-        f.write(json.dumps(deepspeed_config))
-    monkeypatch.setenv("PL_DEEPSPEED_CONFIG_PATH", config_path)
+    monkeypatch.setenv("PL_DEEPSPEED_CONFIG_PATH", deepspeed_config_path)
     plugin = DeepSpeedPlugin()
     assert plugin.config == deepspeed_config
 
@@ -258,8 +286,6 @@ def test_deepspeed_run_configure_optimizers(tmpdir):
 
     class TestCB(Callback):
         def on_train_start(self, trainer, pl_module) -> None:
-            from deepspeed.runtime.zero.stage2 import FP16_DeepSpeedZeroOptimizer
-
             assert isinstance(trainer.optimizers[0], FP16_DeepSpeedZeroOptimizer)
             assert isinstance(trainer.optimizers[0].optimizer, torch.optim.SGD)
             assert isinstance(trainer.lr_schedulers[0]["scheduler"], torch.optim.lr_scheduler.StepLR)
@@ -297,9 +323,6 @@ def test_deepspeed_config(tmpdir, deepspeed_zero_config):
 
     class TestCB(Callback):
         def on_train_start(self, trainer, pl_module) -> None:
-            from deepspeed.runtime.lr_schedules import WarmupLR
-            from deepspeed.runtime.zero.stage2 import FP16_DeepSpeedZeroOptimizer
-
             assert isinstance(trainer.optimizers[0], FP16_DeepSpeedZeroOptimizer)
             assert isinstance(trainer.optimizers[0].optimizer, torch.optim.SGD)
             assert isinstance(trainer.lr_schedulers[0]["scheduler"], WarmupLR)
@@ -320,80 +343,81 @@ def test_deepspeed_config(tmpdir, deepspeed_zero_config):
     trainer.test(model)
 
 
-@RunIf(min_gpus=1, deepspeed=True, special=True)
+@RunIf(min_gpus=1, amp_native=True, deepspeed=True)
 def test_deepspeed_custom_precision_params(tmpdir):
     """Ensure if we modify the FP16 parameters via the DeepSpeedPlugin, the deepspeed config contains these
     changes."""
+    ds = DeepSpeedPlugin(loss_scale=10, initial_scale_power=10, loss_scale_window=10, hysteresis=10, min_loss_scale=10)
+    trainer = Trainer(default_root_dir=tmpdir, plugins=[ds], precision=16, gpus=1, fast_dev_run=True)
 
-    class TestCB(Callback):
-        def on_train_start(self, trainer, pl_module) -> None:
-            assert trainer.training_type_plugin.config["fp16"]["loss_scale"] == 10
-            assert trainer.training_type_plugin.config["fp16"]["initial_scale_power"] == 10
-            assert trainer.training_type_plugin.config["fp16"]["loss_scale_window"] == 10
-            assert trainer.training_type_plugin.config["fp16"]["hysteresis"] == 10
-            assert trainer.training_type_plugin.config["fp16"]["min_loss_scale"] == 10
-            raise SystemExit()
+    # stop once the engine would be created, only the config it receives after the plugin setup is checked
+    with mock.patch("deepspeed.initialize", side_effect=SystemExit) as mock_initialize, pytest.raises(SystemExit):
+        trainer.fit(BoringModel())
 
-    model = BoringModel()
-    ds = DeepSpeedPlugin(loss_scale=10, initial_scale_power=10, loss_scale_window=10, hysteresis=10, min_loss_scale=10)
-    trainer = Trainer(default_root_dir=tmpdir, plugins=[ds], precision=16, gpus=1, callbacks=[TestCB()])
-    with pytest.raises(SystemExit):
-        trainer.fit(model)
+    fp16_config = mock_initialize.call_args[1]["config"]["fp16"]
+    assert fp16_config["loss_scale"] == 10
+    assert fp16_config["initial_scale_power"] == 10
+    assert fp16_config["loss_scale_window"] == 10
+    assert fp16_config["hysteresis"] == 10
+    assert fp16_config["min_loss_scale"] == 10
 
 
 @RunIf(deepspeed=True)
-def test_deepspeed_custom_activation_checkpointing_params(tmpdir):
-    """Ensure if we modify the activation checkpointing parameters, the deepspeed config contains these changes."""
-    ds = DeepSpeedPlugin(
-        partition_activations=True,
-        cpu_checkpointing=True,
-        contiguous_memory_optimization=True,
-        synchronize_checkpoint_boundary=True,
-    )
-    checkpoint_config = ds.config["activation_checkpointing"]
-    assert checkpoint_config["partition_activations"]
-    assert checkpoint_config["cpu_checkpointing"]
-    assert checkpoint_config["contiguous_memory_optimization"]
-    assert checkpoint_config["synchronize_checkpoint_boundary"]
-
+@pytest.mark.parametrize(
+    ["plugin_kwargs", "expected_config"],
+    [
+        pytest.param(
+            dict(
+                partition_activations=True,
+                cpu_checkpointing=True,
+                contiguous_memory_optimization=True,
+                synchronize_checkpoint_boundary=True,
+            ),
+            {
+                "activation_checkpointing": {
+                    "partition_activations": True,
+                    "cpu_checkpointing": True,
+                    "contiguous_memory_optimization": True,
+                    "synchronize_checkpoint_boundary": True,
+                }
+            },
+            id="activation_checkpointing",
+        ),
+    ],
+)
+def test_deepspeed_config_params(plugin_kwargs, expected_config):
+    """Ensure the parameters passed to the DeepSpeedPlugin, either as arguments or within a config, end up in the
+    deepspeed config."""
+    plugin = DeepSpeedPlugin(**plugin_kwargs)
+    for section, params in expected_config.items():
+        for key, value in params.items():
+            assert plugin.config[section][key] is value
 
-@RunIf(min_gpus=1, deepspeed=True)
-def test_deepspeed_assert_config_zero_offload_disabled(tmpdir, deepspeed_zero_config):
-    """Ensure if we use a config and turn off offload_optimizer, that this is set to False within the config."""
 
+@RunIf(deepspeed=True)
+def test_deepspeed_assert_config_zero_offload_disabled(deepspeed_zero_config):
+    """Ensure if we use a config and turn off offload_optimizer, that this is set to False within the config, and
+    that the plugin only adds an offload_optimizer section when asked to."""
     deepspeed_zero_config["zero_optimization"]["offload_optimizer"] = False
+    plugin = DeepSpeedPlugin(config=deepspeed_zero_config)
+    assert plugin.config["zero_optimization"] == {"stage": 2, "offload_optimizer": False}
+    assert plugin.config["optimizer"] == {"type": "SGD", "params": {"lr": 3e-5}}
 
-    class TestCallback(Callback):
-        def on_before_accelerator_backend_setup(self, trainer, pl_module) -> None:
-            assert trainer.training_type_plugin.config["zero_optimization"]["offload_optimizer"] is False
-            raise SystemExit()
-
-    model = BoringModel()
-    trainer = Trainer(
-        default_root_dir=tmpdir,
-        progress_bar_refresh_rate=0,
-        max_epochs=1,
-        plugins=[DeepSpeedPlugin(config=deepspeed_zero_config)],
-        precision=16,
-        gpus=1,
-        callbacks=[TestCallback()],
-    )
-    with pytest.raises(SystemExit):
-        trainer.fit(model)
+    assert "offload_optimizer" not in DeepSpeedPlugin().config["zero_optimization"]
+    assert "offload_optimizer" not in DeepSpeedPlugin(offload_optimizer=False).config["zero_optimization"]
+    offload_config = DeepSpeedPlugin(offload_optimizer=True, offload_optimizer_device="nvme").config
+    assert offload_config["zero_optimization"]["offload_optimizer"]["device"] == "nvme"
 
 
 @RunIf(min_gpus=2, deepspeed=True, special=True)
-def test_deepspeed_multigpu(tmpdir):
+def test_deepspeed_multigpu(tmpdir, stage3_trainer_factory):
     """Test to ensure that DeepSpeed with multiple GPUs works and deepspeed distributed is initialized
     correctly."""
     model = BoringModel()
-    trainer = Trainer(
-        default_root_dir=tmpdir, plugins=[DeepSpeedPlugin(stage=3)], gpus=2, fast_dev_run=True, precision=16
-    )
+    trainer = stage3_trainer_factory()
     with mock.patch("deepspeed.init_distributed", wraps=deepspeed.init_distributed) as mock_deepspeed_distributed:
         trainer.fit(model)
     mock_deepspeed_distributed.assert_called_once()
-    trainer.test(model)
 
     _assert_save_model_is_equal(model, tmpdir, trainer)
 
@@ -406,12 +430,10 @@ def test_deepspeed_fp32_works(tmpdir):
 
 
 @RunIf(min_gpus=2, deepspeed=True, special=True)
-def test_deepspeed_stage_3_save_warning(tmpdir):
+def test_deepspeed_stage_3_save_warning(tmpdir, stage3_trainer_factory):
     """Test to ensure that DeepSpeed Stage 3 gives a warning when saving on rank zero."""
     model = BoringModel()
-    trainer = Trainer(
-        default_root_dir=tmpdir, plugins=[DeepSpeedPlugin(stage=3)], gpus=2, fast_dev_run=True, precision=16
-    )
+    trainer = stage3_trainer_factory()
     trainer.fit(model)
     checkpoint_path = os.path.join(tmpdir, "model.pt")
 
@@ -426,17 +448,23 @@ def test_deepspeed_stage_3_save_warning(tmpdir):
 
 
 @RunIf(min_gpus=1, deepspeed=True, special=True)
-def test_deepspeed_multigpu_single_file(tmpdir):
+def test_deepspeed_multigpu_single_file(tmpdir, stage3_trainer_factory):
     """Test to ensure that DeepSpeed loads from a single file checkpoint."""
     model = BoringModel()
     checkpoint_path = os.path.join(tmpdir, "model.pt")
-    trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=True)
-    trainer.fit(model)
-    trainer.save_checkpoint(checkpoint_path)
+    # a minimal non-DeepSpeed checkpoint, producing it does not require fitting
+    checkpoint = {
+        "epoch": 0,
+        "global_step": 0,
+        "pytorch-lightning_version": __version__,
+        "state_dict": model.state_dict(),
+        "callbacks": {},
+        "optimizer_states": [],
+        "lr_schedulers": [],
+    }
+    torch.save(checkpoint, checkpoint_path)
 
-    trainer = Trainer(
-        default_root_dir=tmpdir, plugins=[DeepSpeedPlugin(stage=3)], gpus=1, fast_dev_run=True, precision=16
-    )
+    trainer = stage3_trainer_factory(gpus=1)
     plugin = trainer.training_type_plugin
     assert isinstance(plugin, DeepSpeedPlugin)
     assert not plugin.load_full_weights
@@ -475,9 +503,8 @@ class ModelParallelClassificationModel(LightningModule):
 
     def forward(self, x):
         x = self.model(x)
-        # Ensure output is in float32 for softmax operation
-        x = x.float()
-        logits = F.softmax(x, dim=1)
+        # Ensure output is in float32 for the loss computation, `cross_entropy` applies the log-softmax itself
+        logits = x.float()
         return logits
 
     def training_step(self, batch, batch_idx):
@@ -485,7 +512,8 @@ class ModelParallelClassificationModel(LightningModule):
         logits = self.forward(x)
         loss = F.cross_entropy(logits, y)
         self.log("train_loss", loss, prog_bar=True)
-        self.log("train_acc", self.train_acc(logits, y), prog_bar=True, sync_dist=True)
+        # logged on step for the progress bar only, syncing it would all-reduce on every step
+        self.log("train_acc", self.train_acc(logits, y), prog_bar=True)
         return {"loss": loss}
 
     def validation_step(self, batch, batch_idx):
@@ -528,47 +556,43 @@ class ManualModelParallelClassificationModel(ModelParallelClassificationModel):
         loss = F.cross_entropy(logits, y)
         opt = self.optimizers()
         self.log("train_loss", loss, prog_bar=True)
-        self.log("train_acc", self.train_acc(logits, y), prog_bar=True, sync_dist=True)
+        self.log("train_acc", self.train_acc(logits, y), prog_bar=True)
         opt.zero_grad()
         self.manual_backward(loss)
         opt.step()
 
 
 @RunIf(min_gpus=2, deepspeed=True, special=True)
-def test_deepspeed_multigpu_stage_3(tmpdir, deepspeed_config):
+def test_deepspeed_multigpu_stage_3(tmpdir, stage3_trainer_factory):
     """Test to ensure ZeRO Stage 3 works with a parallel model."""
     model = ModelParallelBoringModel()
-    trainer = Trainer(
-        default_root_dir=tmpdir, plugins=[DeepSpeedPlugin(stage=3)], gpus=2, fast_dev_run=True, precision=16
-    )
+    trainer = stage3_trainer_factory()
     trainer.fit(model)
-    trainer.test(model)
 
     _assert_save_model_is_equal(model, tmpdir, trainer)
 
 
 @RunIf(min_gpus=2, deepspeed=True, special=True)
-def test_deepspeed_multigpu_stage_3_manual_optimization(tmpdir, deepspeed_config):
+def test_deepspeed_multigpu_stage_3_manual_optimization(tmpdir, stage3_trainer_factory):
     """Test to ensure ZeRO Stage 3 works with a parallel model."""
     model = ModelParallelBoringModelManualOptim()
     model.training_epoch_end = None
-    trainer = Trainer(
-        default_root_dir=tmpdir, plugins=[DeepSpeedPlugin(stage=3)], gpus=2, fast_dev_run=True, precision=16
-    )
+    trainer = stage3_trainer_factory()
     trainer.fit(model)
-    trainer.test(model)
 
     _assert_save_model_is_equal(model, tmpdir, trainer)
 
 
 def run_checkpoint_test(tmpdir: str, automatic_optimization: bool = True, accumulate_grad_batches: int = 2):
-    seed_everything(1)
+    # only the model initialization needs to be reproducible, the data splits are seeded by `ClassifDataModule`
+    torch.manual_seed(1)
+    torch.cuda.manual_seed_all(1)
     if automatic_optimization:
         model = ModelParallelClassificationModel()
     else:
         model = ManualModelParallelClassificationModel()
-    dm = ClassifDataModule()
-    ck = ModelCheckpoint(monitor="val_acc", mode="max", save_last=True, save_top_k=-1)
+    dm = ClassifDataModule(num_workers=2, pin_memory=True)
+    ck = ModelCheckpoint(monitor="val_acc", mode="max", save_last=False, save_top_k=1)
     trainer = Trainer(
         default_root_dir=tmpdir,
         max_epochs=10,
@@ -641,9 +665,10 @@ def test_deepspeed_multigpu_stage_3_resume_training(tmpdir):
     initial_trainer = Trainer(
         default_root_dir=tmpdir,
         max_epochs=1,
-        limit_train_batches=2,
-        limit_val_batches=2,
-        limit_test_batches=2,
+        limit_train_batches=1,
+        limit_val_batches=1,
+        limit_test_batches=1,
+        num_sanity_val_steps=0,
         plugins=DeepSpeedPlugin(stage=3),
         gpus=1,
         precision=16,
@@ -694,18 +719,9 @@ def test_deepspeed_multigpu_stage_3_checkpointing_full_weights_manual(tmpdir):
 
 
 @RunIf(min_gpus=2, deepspeed=True, special=True)
-def test_deepspeed_multigpu_stage_2_accumulated_grad_batches(tmpdir):
-    _deepspeed_multigpu_stage_2_accumulated_grad_batches(tmpdir, offload_optimizer=False)
-
-
-@RunIf(min_gpus=2, deepspeed=True, special=True)
-def test_deepspeed_multigpu_stage_2_accumulated_grad_batches_offload_optimizer(tmpdir):
-    _deepspeed_multigpu_stage_2_accumulated_grad_batches(tmpdir, offload_optimizer=True)
-
-
-def _deepspeed_multigpu_stage_2_accumulated_grad_batches(tmpdir, offload_optimizer):
+@pytest.mark.parametrize("offload_optimizer", [False, True])
+def test_deepspeed_multigpu_stage_2_accumulated_grad_batches(tmpdir, offload_optimizer):
     """Test to ensure with Stage 2 and multiple GPUs, accumulated grad batches works."""
-    seed_everything(42)
 
     class VerificationCallback(Callback):
         def __init__(self):
@@ -730,7 +746,7 @@ def _deepspeed_multigpu_stage_2_accumulated_grad_batches(tmpdir, offload_optimiz
         max_epochs=1,
         plugins=[DeepSpeedPlugin(stage=2, offload_optimizer=offload_optimizer)],
         gpus=2,
-        limit_train_batches=5,
+        limit_train_batches=3,
         limit_val_batches=2,
         precision=16,
         accumulate_grad_batches=2,
@@ -742,17 +758,15 @@ def _deepspeed_multigpu_stage_2_accumulated_grad_batches(tmpdir, offload_optimiz
 
 
 @RunIf(min_gpus=2, deepspeed=True, special=True)
-def test_deepspeed_multigpu_test(tmpdir):
+def test_deepspeed_multigpu_test(stage3_trainer_factory):
     """Test to ensure we can use DeepSpeed with just test using ZeRO Stage 3."""
     model = ModelParallelBoringModel()
-    trainer = Trainer(
-        default_root_dir=tmpdir, plugins=[DeepSpeedPlugin(stage=3)], gpus=2, fast_dev_run=True, precision=16
-    )
+    trainer = stage3_trainer_factory()
     trainer.test(model)
 
 
 @RunIf(min_gpus=1, deepspeed=True, special=True)
-def test_deepspeed_multigpu_partial_partition_parameters(tmpdir):
+def test_deepspeed_multigpu_partial_partition_parameters(stage3_trainer_factory):
     """Test to ensure that a module that defines a layer inside the ``__init__`` and ``configure_sharded_model``
     correctly converts all parameters to float16 when ``precision=16`` and runs successfully."""
 
@@ -769,17 +783,15 @@ def test_deepspeed_multigpu_partial_partition_parameters(tmpdir):
             return self.layer(x)
 
         def on_train_epoch_start(self) -> None:
-            assert all([x.dtype == torch.float16 for x in self.parameters()])
+            assert all(x.dtype is torch.float16 for x in self.parameters())
 
     model = TestModel()
-    trainer = Trainer(
-        default_root_dir=tmpdir, plugins=[DeepSpeedPlugin(stage=3)], gpus=1, fast_dev_run=True, precision=16
-    )
+    trainer = stage3_trainer_factory(gpus=1)
     trainer.fit(model)
 
 
 @RunIf(min_gpus=1, deepspeed=True, special=True)
-def test_deepspeed_multigpu_test_rnn(tmpdir):
+def test_deepspeed_multigpu_test_rnn(stage3_trainer_factory):
     """Test to ensure that turning off explicit partitioning of the entire module for ZeRO Stage 3 works when
     training with certain layers which will crash with explicit partitioning."""
 
@@ -789,88 +801,100 @@ def test_deepspeed_multigpu_test_rnn(tmpdir):
             self.rnn = torch.nn.GRU(32, 32)
 
         def on_train_epoch_start(self) -> None:
-            assert all([x.dtype == torch.float16 for x in self.parameters()])
+            assert all(x.dtype is torch.float16 for x in self.parameters())
 
     model = TestModel()
-    trainer = Trainer(
-        default_root_dir=tmpdir,
-        plugins=[DeepSpeedPlugin(stage=3, partition_module=False)],
-        gpus=1,
-        fast_dev_run=True,
-        precision=16,
-    )
+    trainer = stage3_trainer_factory(plugins=[DeepSpeedPlugin(stage=3, partition_module=False)], gpus=1)
     trainer.fit(model)
 
 
 @RunIf(deepspeed=True)
-@mock.patch("deepspeed.init_distributed", autospec=True)
 @pytest.mark.parametrize("platform", ["Linux", "Windows"])
-def test_deepspeed_plugin_env_variables(mock_deepspeed_distributed, tmpdir, platform):
+def test_deepspeed_plugin_env_variables(tmpdir, monkeypatch, platform):
     """Test to ensure that we setup distributed communication using correctly.
 
     When using windows, ranks environment variables should not be set, and deepspeed should handle this.
     """
-    trainer = Trainer(default_root_dir=tmpdir, plugins=[DeepSpeedPlugin(stage=3)])
-    plugin = trainer.training_type_plugin
-    assert isinstance(plugin, DeepSpeedPlugin)
-    with mock.patch("platform.system", return_value=platform) as mock_platform:
+    env_variables = ("MASTER_PORT", "MASTER_ADDR", "RANK", "WORLD_SIZE", "LOCAL_RANK")
+    mock_deepspeed_distributed = mock.Mock()
+    monkeypatch.setattr(deepspeed, "init_distributed", mock_deepspeed_distributed)
+    mock_platform = mock.Mock(return_value=platform)
+    monkeypatch.setattr("platform.system", mock_platform)
+
+    # the plugin writes these to `os.environ`, restore it on exit so they don't leak into the next parametrization
+    with mock.patch.dict(os.environ):
+        for k in env_variables:
+            os.environ.pop(k, None)
+
+        trainer = Trainer(default_root_dir=tmpdir, plugins=[DeepSpeedPlugin(stage=3)])
+        plugin = trainer.training_type_plugin
+        assert isinstance(plugin, DeepSpeedPlugin)
         plugin._init_deepspeed_distributed()
-    mock_deepspeed_distributed.assert_called()
-    mock_platform.assert_called()
-    if platform == "Windows":
-        # assert no env variables have been set within the DeepSpeedPlugin
-        assert all(k not in os.environ for k in ("MASTER_PORT", "MASTER_ADDR", "RANK", "WORLD_SIZE", "LOCAL_RANK"))
-    else:
-        assert os.environ["MASTER_ADDR"] == str(trainer.training_type_plugin.cluster_environment.master_address())
-        assert os.environ["MASTER_PORT"] == str(trainer.training_type_plugin.cluster_environment.master_port())
-        assert os.environ["RANK"] == str(trainer.training_type_plugin.global_rank)
-        assert os.environ["WORLD_SIZE"] == str(trainer.training_type_plugin.world_size)
-        assert os.environ["LOCAL_RANK"] == str(trainer.training_type_plugin.local_rank)
+        mock_deepspeed_distributed.assert_called()
+        mock_platform.assert_called()
+        if platform == "Windows":
+            # assert no env variables have been set within the DeepSpeedPlugin
+            assert all(k not in os.environ for k in env_variables)
+        else:
+            assert os.environ["MASTER_ADDR"] == str(trainer.training_type_plugin.cluster_environment.master_address())
+            assert os.environ["MASTER_PORT"] == str(trainer.training_type_plugin.cluster_environment.master_port())
+            assert os.environ["RANK"] == str(trainer.training_type_plugin.global_rank)
+            assert os.environ["WORLD_SIZE"] == str(trainer.training_type_plugin.world_size)
+            assert os.environ["LOCAL_RANK"] == str(trainer.training_type_plugin.local_rank)
 
 
 def _assert_save_model_is_equal(model, tmpdir, trainer):
     checkpoint_path = os.path.join(tmpdir, "model.pt")
+    # each rank re-runs pytest in its own process and gets a different `tmpdir`, use rank 0's so the shards meet
     checkpoint_path = trainer.accelerator.broadcast(checkpoint_path)
     trainer.save_checkpoint(checkpoint_path)
     trainer.accelerator.barrier()
 
     # carry out the check only on rank 0
     if trainer.is_global_zero:
-        single_ckpt_path = os.path.join(tmpdir, "single_model.pt")
-        convert_zero_checkpoint_to_fp32_state_dict(checkpoint_path, single_ckpt_path)
-        state_dict = torch.load(single_ckpt_path)
+        # consolidate the shards in memory, writing them back out as a single file is covered elsewhere
+        state_dict = get_fp32_state_dict_from_zero_checkpoint(checkpoint_path)
 
         model = model.cpu()
-        # Assert model parameters are identical after loading
-        for orig_param, saved_model_param in zip(model.parameters(), state_dict.values()):
-            if model.dtype == torch.half:
-                # moved model to float32 for comparison with single fp32 saved weights
-                saved_model_param = saved_model_param.half()
-            assert torch.equal(orig_param, saved_model_param)
+        # Assert model parameters are identical after loading, comparing all of them at once
+        orig_params = parameters_to_vector(model.parameters())
+        saved_model_params = parameters_to_vector(state_dict.values())
+        if model.dtype == torch.half:
+            # moved model to float32 for comparison with single fp32 saved weights
+            saved_model_params = saved_model_params.half()
+        assert torch.equal(orig_params, saved_model_params)
 
 
 @RunIf(min_gpus=2, deepspeed=True, special=True)
-def test_deepspeed_multigpu_no_schedulers(tmpdir):
+def test_deepspeed_multigpu_no_schedulers(tmpdir, stage3_trainer_factory):
     """Test to ensure ZeRO Stage 3 works with a parallel model and no schedulers."""
     model = ModelParallelBoringModelNoSchedulers()
-    trainer = Trainer(
-        default_root_dir=tmpdir, plugins=[DeepSpeedPlugin(stage=3)], gpus=2, fast_dev_run=True, precision=16
-    )
+    trainer = stage3_trainer_factory()
     trainer.fit(model)
 
     _assert_save_model_is_equal(model, tmpdir, trainer)
 
 
-@RunIf(min_gpus=1, deepspeed=True)
-def test_deepspeed_skip_backward_raises(tmpdir):
+def test_deepspeed_skip_backward_raises():
+    """Test that the DeepSpeed precision plugin raises when the backward is skipped by returning ``None`` from
+    ``training_step``."""
+
     class TestModel(BoringModel):
         def training_step(self, batch, batch_idx):
             return None
 
     model = TestModel()
-    trainer = Trainer(default_root_dir=tmpdir, plugins=[DeepSpeedPlugin()], gpus=1, fast_dev_run=True, precision=16)
+    model.trainer = mock.Mock()
+    batch = torch.randn(2, 32)
+    backward = mock.Mock()
+    # the closure the optimizer loop builds, running the `training_step` and skipping the backward on `None`
+    closure = Closure(
+        step_fn=lambda: ClosureResult.from_training_step_output(model.training_step(batch, 0)), backward_fn=backward
+    )
+    precision_plugin = DeepSpeedPrecisionPlugin(precision=16)
     with pytest.raises(MisconfigurationException, match="returning `None` .* is not supported"):
-        trainer.fit(model)
+        precision_plugin.pre_optimizer_step(model, mock.Mock(), 0, lambda_closure=closure)
+    backward.assert_not_called()
 
 
 @RunIf(min_gpus=1, deepspeed=True, special=True)
@@ -898,19 +922,24 @@ def test_deepspeed_setup_train_dataloader(tmpdir):
             self._setup = False
 
         def setup(self, stage: Optional[str] = None) -> None:
+            if not self._setup:
+                # build the loaders once, the trainer requests them for every stage
+                self._train = DataLoader(RandomDataset(32, 64), batch_size=2)
+                self._val = DataLoader(RandomDataset(32, 64), batch_size=2)
+                self._test = DataLoader(RandomDataset(32, 64), batch_size=2)
             self._setup = True
 
         def train_dataloader(self):
             assert self._setup
-            return DataLoader(RandomDataset(32, 64), batch_size=2)
+            return self._train
 
         def val_dataloader(self):
             assert self._setup
-            return DataLoader(RandomDataset(32, 64), batch_size=2)
+            return self._val
 
         def test_dataloader(self):
             assert self._setup
-            return DataLoader(RandomDataset(32, 64), batch_size=2)
+            return self._test
 
     model = BoringModel()
     trainer = Trainer(
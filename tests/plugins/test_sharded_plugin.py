@@ -3,6 +3,8 @@ from unittest import mock
 
 import pytest
 import torch
+from torch.nn.utils import parameters_to_vector
+from torch.utils.data import DataLoader
 
 from pytorch_lightning import LightningModule, Trainer
 from pytorch_lightning.callbacks import Callback
@@ -10,7 +12,7 @@ from pytorch_lightning.plugins import DDPShardedPlugin, DDPSpawnShardedPlugin
 from pytorch_lightning.trainer.states import TrainerFn
 from pytorch_lightning.utilities import _FAIRSCALE_AVAILABLE
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
-from tests.helpers.boring_model import BoringModel
+from tests.helpers.boring_model import BoringModel, RandomDataset
 from tests.helpers.runif import RunIf
 
 if _FAIRSCALE_AVAILABLE:
@@ -83,27 +85,11 @@ def test_ddp_choice_sharded_amp(tmpdir, accelerator):
 
 
 @RunIf(skip_windows=True, fairscale=True)
-def test_ddp_sharded_plugin_checkpoint_cpu(tmpdir):
+@pytest.mark.parametrize("trainer_kwargs", (dict(num_processes=2), pytest.param(dict(gpus=2), marks=RunIf(min_gpus=2))))
+def test_ddp_sharded_plugin_checkpoint(tmpdir, trainer_kwargs):
     """Test to ensure that checkpoint is saved correctly."""
     model = BoringModel()
-    trainer = Trainer(accelerator="ddp_sharded_spawn", num_processes=2, fast_dev_run=True)
-
-    trainer.fit(model)
-
-    checkpoint_path = os.path.join(tmpdir, "model.pt")
-    trainer.save_checkpoint(checkpoint_path)
-    saved_model = BoringModel.load_from_checkpoint(checkpoint_path)
-
-    # Assert model parameters are identical after loading
-    for ddp_param, shard_param in zip(model.parameters(), saved_model.parameters()):
-        assert torch.equal(ddp_param.to("cpu"), shard_param)
-
-
-@RunIf(min_gpus=2, skip_windows=True, fairscale=True)
-def test_ddp_sharded_plugin_checkpoint_multi_gpu(tmpdir):
-    """Test to ensure that checkpoint is saved correctly when using multiple GPUs."""
-    model = BoringModel()
-    trainer = Trainer(gpus=2, accelerator="ddp_sharded_spawn", fast_dev_run=True)
+    trainer = Trainer(accelerator="ddp_sharded_spawn", fast_dev_run=True, **trainer_kwargs)
 
     trainer.fit(model)
 
@@ -112,8 +98,8 @@ def test_ddp_sharded_plugin_checkpoint_multi_gpu(tmpdir):
     saved_model = BoringModel.load_from_checkpoint(checkpoint_path)
 
     # Assert model parameters are identical after loading
-    for ddp_param, shard_param in zip(model.parameters(), saved_model.parameters()):
-        assert torch.equal(ddp_param.to("cpu"), shard_param)
+    ddp_params = parameters_to_vector(model.parameters()).to("cpu")
+    assert torch.equal(ddp_params, parameters_to_vector(saved_model.parameters()))
 
 
 @RunIf(min_gpus=2, skip_windows=True, fairscale=True)
@@ -127,15 +113,19 @@ def test_ddp_sharded_plugin_finetune(tmpdir):
     trainer.save_checkpoint(checkpoint_path)
     saved_model = BoringModel.load_from_checkpoint(checkpoint_path)
 
-    trainer = Trainer(fast_dev_run=True)
-    trainer.fit(saved_model)
+    # a training step through the loaded weights is enough to show that training can continue
+    batch = next(iter(saved_model.train_dataloader()))
+    loss = saved_model.training_step(batch, 0)["loss"]
+    loss.backward()
+    assert all(p.grad is not None for p in saved_model.parameters())
 
 
 @RunIf(skip_windows=True, fairscale=True)
-def test_ddp_sharded_plugin_resume_from_checkpoint(tmpdir):
-    """Test to ensure that resuming from checkpoint works."""
+@pytest.mark.parametrize("trainer_kwargs", (dict(num_processes=2), pytest.param(dict(gpus=1), marks=RunIf(min_gpus=1))))
+def test_ddp_sharded_plugin_resume_from_checkpoint(tmpdir, trainer_kwargs):
+    """Test to ensure that resuming from checkpoint works, also when going from GPUs -> CPU."""
     model = BoringModel()
-    trainer = Trainer(accelerator="ddp_sharded_spawn", num_processes=2, fast_dev_run=True)
+    trainer = Trainer(accelerator="ddp_sharded_spawn", fast_dev_run=True, **trainer_kwargs)
 
     trainer.fit(model)
 
@@ -173,38 +163,35 @@ def test_ddp_sharded_plugin_resume_from_checkpoint_downsize_gpus(tmpdir):
     trainer.fit(model)
 
 
-@RunIf(min_gpus=1, skip_windows=True, fairscale=True)
-def test_ddp_sharded_plugin_resume_from_checkpoint_gpu_to_cpu(tmpdir):
-    """Test to ensure that resuming from checkpoint works when going from GPUs- > CPU."""
-    model = BoringModel()
-    trainer = Trainer(accelerator="ddp_sharded_spawn", gpus=1, fast_dev_run=True)
-
-    trainer.fit(model)
+class TinyBoringModel(BoringModel):
+    """A ``BoringModel`` with just enough data for the plugin wiring tests, which never train for more than two
+    batches per process."""
 
-    checkpoint_path = os.path.join(tmpdir, "model.pt")
-    trainer.save_checkpoint(checkpoint_path)
+    def train_dataloader(self):
+        return DataLoader(RandomDataset(32, 4))
 
-    model = BoringModel()
+    def val_dataloader(self):
+        return DataLoader(RandomDataset(32, 4))
 
-    trainer = Trainer(
-        accelerator="ddp_sharded_spawn", num_processes=2, fast_dev_run=True, resume_from_checkpoint=checkpoint_path
-    )
+    def test_dataloader(self):
+        return DataLoader(RandomDataset(32, 4))
 
-    trainer.fit(model)
+    def predict_dataloader(self):
+        return DataLoader(RandomDataset(32, 4))
 
 
 @RunIf(skip_windows=True, special=True, fairscale=True)
 @pytest.mark.parametrize("trainer_kwargs", (dict(num_processes=2), pytest.param(dict(gpus=2), marks=RunIf(min_gpus=2))))
 def test_ddp_sharded_plugin_test_multigpu(tmpdir, trainer_kwargs):
     """Test to ensure we can use validate and test without fit."""
-    model = BoringModel()
+    model = TinyBoringModel()
     trainer = Trainer(accelerator="ddp_sharded_spawn", fast_dev_run=True, **trainer_kwargs)
 
     trainer.validate(model)
     trainer.test(model)
 
 
-class ManualBoringModel(BoringModel):
+class ManualBoringModel(TinyBoringModel):
     def __init__(self):
         super().__init__()
         self.automatic_optimization = False
@@ -234,7 +221,7 @@ def test_ddp_sharded_plugin_manual_optimization(tmpdir):
     trainer.fit(model)
 
 
-class BoringModelSharded(BoringModel):
+class BoringModelSharded(TinyBoringModel):
     def on_train_start(self) -> None:
         """Check if trainer module is wrapped as ShardedDataParallel during training stage."""
         assert isinstance(self.trainer.model, ShardedDataParallel)
@@ -268,40 +255,38 @@ def test_configure_ddp(tmpdir):
     trainer.predict(model, dataloaders=model.predict_dataloader())
 
 
+@pytest.fixture
+def mock_sharded():
+    """Patches ``ShardedDataParallel`` for both sharded plugins and returns the mocks per plugin class."""
+    target = "pytorch_lightning.plugins.training_type.{}.ShardedDataParallel"
+    with mock.patch.object(DDPShardedPlugin, "_wrap_optimizers"):
+        with mock.patch(target.format("sharded"), autospec=True) as sharded:
+            with mock.patch(target.format("sharded_spawn"), autospec=True) as sharded_spawn:
+                yield {DDPShardedPlugin: sharded, DDPSpawnShardedPlugin: sharded_spawn}
+
+
 @RunIf(skip_windows=True, fairscale=True)
-@mock.patch("pytorch_lightning.plugins.DDPShardedPlugin._wrap_optimizers", autospec=True)
 @pytest.mark.parametrize("cls", [DDPShardedPlugin, DDPSpawnShardedPlugin])
-def test_custom_kwargs_sharded(tmpdir, cls):
+def test_custom_kwargs_sharded(mock_sharded, cls):
     """Tests to ensure that if custom kwargs are passed, they are set correctly."""
     plugin = cls(reduce_fp16=True)
-
-    class_name = "sharded" if isinstance(plugin, DDPShardedPlugin) else "sharded_spawn"
-
-    with mock.patch.object(plugin, "_model", autospec=True):
-        with mock.patch(
-            f"pytorch_lightning.plugins.training_type.{class_name}.ShardedDataParallel", autospec=True
-        ) as mock_sharded:
-            plugin.configure_ddp()
-    args, kwargs = mock_sharded.call_args
+    with mock.patch.object(plugin, "_model"):
+        plugin.configure_ddp()
+    args, kwargs = mock_sharded[cls].call_args
     assert "reduce_fp16" in kwargs
     assert kwargs["reduce_fp16"]
 
 
 @RunIf(skip_windows=True, fairscale=True)
-@mock.patch("pytorch_lightning.plugins.DDPShardedPlugin._wrap_optimizers", autospec=True)
 @pytest.mark.parametrize(["params", "expected_buffer_size"], [(dict(), 0), (dict(reduce_buffer_size=128), 128)])
 @pytest.mark.parametrize("num_nodes", [1, 2])
-def test_custom_kwargs_sharded_reduce_buffer_size(tmpdir, params, expected_buffer_size, num_nodes):
+def test_custom_kwargs_sharded_reduce_buffer_size(mock_sharded, params, expected_buffer_size, num_nodes):
     """Tests to ensure that ``reduce_buffer_size`` is correctly set based on user kwargs."""
     plugin = DDPShardedPlugin(**params)
     plugin.num_nodes = num_nodes
-
-    with mock.patch.object(plugin, "_model", autospec=True):
-        with mock.patch(
-            "pytorch_lightning.plugins.training_type.sharded.ShardedDataParallel", autospec=True
-        ) as mock_sharded:
-            plugin.configure_ddp()
-    args, kwargs = mock_sharded.call_args
+    with mock.patch.object(plugin, "_model"):
+        plugin.configure_ddp()
+    args, kwargs = mock_sharded[DDPShardedPlugin].call_args
     assert "reduce_buffer_size" in kwargs
 
     if num_nodes > 1 and len(params) == 0:
@@ -11,12 +11,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
+import gc
 import inspect
+import pickle
+import weakref
 
 import pytest
 from torch.jit import ScriptModule
 
 from pytorch_lightning.utilities.parsing import (
+    _deepcopy_hparams,
     AttributeDict,
     clean_namespace,
     collect_init_args,
@@ -155,6 +160,49 @@ def test_lightning_setattr(tmpdir, model_cases):
             lightning_setattr(m, "this_attr_not_exist", None)
 
 
+def test_lightning_attr_holders_follow_changes():
+    """Test that the attribute holders follow changes of the model, its hparams and the datamodule."""
+
+    class DataModule:
+        batch_size = 8
+
+    class Trainer:
+        datamodule = None
+
+    class TestModel:
+        trainer = Trainer()
+        hparams = {"batch_size": 2}
+
+    model = TestModel()
+    assert lightning_getattr(model, "batch_size") == 2
+
+    model.trainer.datamodule = DataModule()
+    assert lightning_getattr(model, "batch_size") == 8
+
+    model.trainer.datamodule = None
+    model.hparams = {"batch_size": 4}
+    assert lightning_getattr(model, "batch_size") == 4
+
+    model.hparams = {}
+    assert not lightning_hasattr(model, "batch_size")
+
+    # an attribute set on the model after a previous lookup is updated as well
+    model.hparams = {"lr": 1}
+    lightning_setattr(model, "lr", 2)
+    model.lr = 5
+    lightning_setattr(model, "lr", 3)
+    assert model.lr == 3
+    assert model.hparams["lr"] == 3
+
+    # a deleted key is not written back
+    del model.lr
+    del model.hparams["lr"]
+    assert not lightning_hasattr(model, "lr")
+    with pytest.raises(AttributeError, match="lr is neither stored in the model namespace"):
+        lightning_setattr(model, "lr", 4)
+    assert "lr" not in model.hparams
+
+
 def test_str_to_bool_or_str():
     true_cases = ["y", "yes", "t", "true", "on", "1"]
     false_cases = ["n", "no", "f", "false", "off", "0"]
@@ -251,6 +299,21 @@ def test_get_init_args(tmpdir):
     assert my_class.result == {}
 
 
+def test_init_args_cache_does_not_keep_classes_alive():
+    def create_model():
+        class AutomaticArgsModel:
+            def __init__(self, anyarg, **kwargs):
+                super().__init__()
+                self.result = get_init_args(inspect.currentframe())
+
+        assert AutomaticArgsModel("test").result == {"anyarg": "test"}
+        return weakref.ref(AutomaticArgsModel)
+
+    class_ref = create_model()
+    gc.collect()
+    assert class_ref() is None
+
+
 def test_collect_init_args():
     class AutomaticArgsParent:
         def __init__(self, anyarg, anykw=42, **kwargs):
@@ -287,6 +350,40 @@ def test_attribute_dict(tmpdir):
     ad.key1 = 123
     assert ad.key1 == 123
 
+    # Test the representation follows updates
+    assert repr(ad) == '"key1": 123'
+    ad.key1 = 1
+    ad.update(key2=[1])
+    assert repr(ad) == '"key1": 1\n"key2": [1]'
+    ad.key2.append(2)
+    assert repr(ad) == '"key1": 1\n"key2": [1, 2]'
+    ad.key2 = "ab"
+    assert repr(ad) == '"key1": 1\n"key2": ab'
+    ad.key10 = 10
+    assert repr(ad) == '"key1":  1\n"key10": 10\n"key2":  ab'
+    del ad["key10"]
+    del ad["key2"]
+    assert repr(ad) == '"key1": 1'
+
+    # Test copies only hold the items
+    assert pickle.loads(pickle.dumps(ad)) == {"key1": 1}
+    assert copy.deepcopy(ad) == {"key1": 1}
+
+
+def test_deepcopy_hparams():
+    immutable = AttributeDict({"a": 1, "b": "abc", "c": (1, ("x", None)), "d": frozenset({2.0})})
+    copied = _deepcopy_hparams(immutable)
+    assert isinstance(copied, AttributeDict)
+    assert copied == immutable and copied is not immutable
+    copied.a = 2
+    assert immutable.a == 1
+
+    mutable = AttributeDict({"a": 1, "b": [1, 2], "c": (1, [2])})
+    copied = _deepcopy_hparams(mutable)
+    assert copied == mutable
+    assert copied.b is not mutable.b
+    assert copied.c[1] is not mutable.c[1]
+
 
 def test_flatten_dict(tmpdir):
     d = {"1": 1, "_": {"2": 2, "_": {"3": 3, "4": 4}}}
@@ -294,3 +391,9 @@ def test_flatten_dict(tmpdir):
     expected = {"1": 1, "2": 2, "3": 3, "4": 4}
 
     assert flatten_dict(d) == expected
+
+    # later values overwrite earlier ones in depth-first order
+    d = {"a": 1, "_": {"a": 2, "b": 2}, "b": 3}
+    flattened = flatten_dict(d)
+    assert flattened == {"a": 2, "b": 3}
+    assert list(flattened) == ["a", "b"]